@@ -11,13 +11,12 @@ Author: Bryan (with Claude)
 """
 
 import re
+import sys
 import json
+import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
-
-# Matches "DOOR SCHEDULE", "DOOR AND FRAME SCHEDULE", "DOOR & FRAME SCHEDULE",
-# "DOOR/FRAME SCHEDULE", etc. — up to 25 chars between DOOR and SCHEDULE.
-_SCHEDULE_TITLE_RE = re.compile(r'DOOR\b.{0,25}SCHEDULE', re.IGNORECASE)
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields as dataclass_fields, asdict
 
 try:
     import pdfplumber
@@ -31,12 +30,55 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+from pdf_text import extract_page_text
+
+# Matches "DOOR SCHEDULE", "DOOR AND FRAME SCHEDULE", "DOOR & FRAME SCHEDULE",
+# "DOOR/FRAME SCHEDULE", etc. — up to 25 chars between DOOR and SCHEDULE.
+_SCHEDULE_TITLE_RE = re.compile(r'DOOR\b.{0,25}SCHEDULE', re.IGNORECASE)
+
+# Material keywords in priority order — each branch is an anchored lookahead,
+# so the first *group* that matches anywhere in the string wins (not the
+# leftmost keyword): "wood/alum" is still aluminum.
+_MATERIAL_RE = re.compile(
+    r'(?P<aluminum>(?=.*alum))'
+    r'|(?P<wood>(?=.*(?:wood|wd)))'
+    r'|(?P<hollow_metal>(?=.*(?:metal|hm|hollow|steel)))'
+    r'|(?P<fiberglass>(?=.*(?:fib|frp)))',
+    re.DOTALL,
+)
+
+# Door type code -> material (see _infer_material_from_type)
+_TYPE_MATERIAL_CODES = {
+    "VA": "aluminum", "SA": "aluminum", "AA": "aluminum",
+    "VW": "wood", "FW": "wood", "SW": "wood",
+    "VM": "hollow_metal", "FM": "hollow_metal", "HM": "hollow_metal",
+    "SM": "hollow_metal",
+}
+_TYPE_MATERIAL_SINGLE = {"A": "aluminum", "W": "wood", "M": "hollow_metal"}
+
+# Shared DoorEntry.raw_data keys — every row reuses the same key objects
+_COL_KEYS = tuple(sys.intern(f"col_{i}") for i in range(64))
+
+# Text-fallback schedule rows: a line starting with a door number in one of
+# the common formats (1, 101, 101A, A-101, A101) followed by whitespace.
+# [^\S\n] is whitespace that can't cross into the next line, so one
+# MULTILINE scan over the page text finds every candidate line.
+_TEXT_ROW_RE = re.compile(
+    r'^[^\S\n]*(?:\d{1,5}[A-Za-z]?|[A-Za-z]-\d{1,4}|[A-Za-z]\d{1,4})[^\S\n].*$',
+    re.MULTILINE,
+)
+_CELL_GAP_RE = re.compile(r'\s{2,}')
+
+# Low-cardinality DoorEntry fields whose values repeat across most rows
+_INTERNED_FIELDS = ("material", "manufacturer", "fire_rating",
+                    "hardware_set", "finish", "door_type")
+
 
 # ─────────────────────────────────────────────
 # Data Models
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DoorEntry:
     """Represents a single door from the schedule."""
     door_number: str
@@ -89,14 +131,9 @@ class DoorEntry:
     def _normalize_material(self) -> str:
         """Normalize material names to standard format."""
         mat = self.material.lower().strip()
-        if any(w in mat for w in ["alum"]):
-            return "aluminum"
-        elif any(w in mat for w in ["wood", "wd"]):
-            return "wood"
-        elif any(w in mat for w in ["metal", "hm", "hollow", "steel"]):
-            return "hollow_metal"
-        elif any(w in mat for w in ["fib", "frp"]):
-            return "fiberglass"
+        m = _MATERIAL_RE.match(mat)
+        if m:
+            return m.lastgroup
         return mat if mat else "unknown"
 
     def _parse_thickness(self) -> float:
@@ -116,6 +153,11 @@ class DoorEntry:
             return 1.75  # Default standard door thickness
 
 
+# DoorEntry fields a parsed row may populate (mapped columns such as
+# frame_finish have no DoorEntry field and are dropped)
+_DOOR_FIELDS = frozenset(f.name for f in dataclass_fields(DoorEntry)) - {"raw_data"}
+
+
 @dataclass
 class ParseResult:
     """Result of parsing a door schedule."""
@@ -222,15 +264,37 @@ COLUMN_ALIASES = {
 }
 
 
+def _clean_cell(cell) -> str:
+    """Return a table cell as a stripped string (None -> "")."""
+    return '' if cell is None else str(cell).strip()
+
+
+class _HeaderCharFilter(dict):
+    """
+    str.translate table that keeps [a-z0-9# /.] and deletes everything else.
+    Filled lazily per code point, so it stays tiny instead of covering all
+    of Unicode up front.
+    """
+    _KEEP = frozenset('abcdefghijklmnopqrstuvwxyz0123456789# /.')
+
+    def __missing__(self, code: int):
+        value = code if chr(code) in self._KEEP else None
+        self[code] = value
+        return value
+
+
+_HEADER_CHAR_FILTER = _HeaderCharFilter()
+
+
+@lru_cache(maxsize=1024)
 def _normalize_header(header: str) -> str:
-    """Normalize a header string for matching."""
+    """Normalize a header string for matching (memoized — headers repeat per page)."""
     if not header:
         return ""
-    h = header.lower().strip()
-    h = re.sub(r'[\n\r]+', ' ', h)  # Replace newlines with space
-    h = re.sub(r'\s+', ' ', h)      # Collapse whitespace
-    h = re.sub(r'[^a-z0-9# /.]', '', h)  # Keep only alphanumeric + a few chars
-    return h.strip()
+    # split()/join() turns newlines and whitespace runs into single spaces,
+    # then one translate() pass drops everything outside [a-z0-9# /.]
+    h = ' '.join(header.lower().split())
+    return h.translate(_HEADER_CHAR_FILTER).strip()
 
 
 def map_columns(headers: List[str]) -> Dict[int, str]:
@@ -279,10 +343,26 @@ def map_columns(headers: List[str]) -> Dict[int, str]:
     return mapping
 
 
+def _mapped_columns(col_mapping: Dict[int, str]) -> List[int]:
+    """Column indexes (in file order) that map to a DoorEntry field."""
+    return sorted(idx for idx, field_name in col_mapping.items() if field_name in _DOOR_FIELDS)
+
+
 # ─────────────────────────────────────────────
 # Size Parsing
 # ─────────────────────────────────────────────
 
+# All three size formats in one pattern, tried in priority order. The first two
+# branches are lookaheads with a lazy .*? so each behaves like re.search()
+# (leftmost match anywhere), and an inch-style match earlier in the string
+# can't pre-empt an architectural one later on.
+_DOOR_SIZE_RE = re.compile(r"""
+      (?=.*?(?P<arch>(?P<arch_w>\d+['\s-]+\d+["\s]*)\s*[xX×]\s*(?P<arch_h>\d+['\s-]+\d+["\s]*)))
+    | (?=.*?(?P<inch>(?P<inch_w>\d+)\s*[xX×]\s*(?P<inch_h>\d+)))
+    | (?P<shorthand>\d{4}$)
+""", re.VERBOSE | re.DOTALL)
+
+
 def parse_door_size(size_str: str) -> Tuple[str, str]:
     """
     Parse a combined door size string into width and height.
@@ -299,27 +379,25 @@ def parse_door_size(size_str: str) -> Tuple[str, str]:
 
     s = size_str.strip()
 
+    m = _DOOR_SIZE_RE.match(s)
+    if not m:
+        return (s, "")
+
+    kind = m.lastgroup
     # Pattern: W'[-]H" x W'[-]H" (architectural notation)
-    arch_pattern = r"(\d+['\s-]+\d+[\"\s]*)\s*[xX×]\s*(\d+['\s-]+\d+[\"\s]*)"
-    m = re.search(arch_pattern, s)
-    if m:
-        return (m.group(1).strip(), m.group(2).strip())
+    if kind == "arch":
+        return (m.group("arch_w").strip(), m.group("arch_h").strip())
 
     # Pattern: WW x HH (inches)
-    inch_pattern = r"(\d+)\s*[xX×]\s*(\d+)"
-    m = re.search(inch_pattern, s)
-    if m:
-        w_in = int(m.group(1))
-        h_in = int(m.group(2))
+    if kind == "inch":
+        w_in = int(m.group("inch_w"))
+        h_in = int(m.group("inch_h"))
         return (_inches_to_arch(w_in), _inches_to_arch(h_in))
 
     # Pattern: WWHH (4-digit shorthand, e.g. 3070 = 3'-0" x 7'-0")
-    if re.match(r'^\d{4}$', s):
-        w = int(s[:2])
-        h = int(s[2:])
-        return (_inches_to_arch(w), _inches_to_arch(h))
-
-    return (s, "")
+    w = int(s[:2])
+    h = int(s[2:])
+    return (_inches_to_arch(w), _inches_to_arch(h))
 
 
 def _inches_to_arch(inches: int) -> str:
@@ -329,6 +407,28 @@ def _inches_to_arch(inches: int) -> str:
     return f"{feet}'-{remaining}\""
 
 
+# ─────────────────────────────────────────────
+# Material Inference
+# ─────────────────────────────────────────────
+
+@lru_cache(maxsize=256)
+def _infer_material_from_type(door_type: str) -> str:
+    """
+    Infer door material from type codes.
+    Common conventions:
+        VA = Vision Aluminum, VW = Vision Wood, VM = Vision Metal
+        FA = Flush Aluminum, FW = Flush Wood, FM = Flush Metal
+        SA = Storefront Aluminum
+    """
+    dt = door_type.upper().strip()
+    if len(dt) >= 2:
+        # Try first two characters, then just the second character
+        # (V=vision prefix, then material)
+        return (_TYPE_MATERIAL_CODES.get(dt[:2])
+                or _TYPE_MATERIAL_SINGLE.get(dt[1], ""))
+    return ""
+
+
 # ─────────────────────────────────────────────
 # Main Parser
 # ─────────────────────────────────────────────
@@ -547,19 +647,23 @@ class DoorScheduleParser:
                     size_col = idx
                     break
 
-        # Build door entries
+        # Build door entries, noting whether any door has hardware/material
+        # as we go rather than rescanning the list afterwards
         doors = []
-        for row_idx, row in enumerate(all_rows):
+        has_hardware = has_material = False
+        for row_idx, row in enumerate(self._normalize_rows(all_rows)):
             door = self._row_to_door(row, col_mapping, size_col)
             if door:
                 doors.append(door)
+                has_hardware = has_hardware or bool(door.hardware_set)
+                has_material = has_material or bool(door.material)
             else:
                 self._log(f"Row {row_idx} skipped: {row}")
 
         # Detect warnings
-        if not any(d.hardware_set for d in doors):
+        if not has_hardware:
             warnings.append("No hardware set column detected — hardware compatibility checking will not be possible")
-        if not any(d.material for d in doors):
+        if not has_material:
             warnings.append("No material column detected — some compatibility checks may be limited")
 
         readable_mapping = {}
@@ -602,12 +706,7 @@ class DoorScheduleParser:
         headers, combined = schedules[0]
         col_count = len(headers)
         for _, rows in schedules[1:]:
-            for row in rows:
-                if len(row) < col_count:
-                    row = row + [''] * (col_count - len(row))
-                elif len(row) > col_count:
-                    row = row[:col_count]
-                combined.append(row)
+            combined.extend(self._normalize_rows(rows, col_count))
         self._log(f"Merged {len(schedules)} door schedules into {len(combined)} rows")
         return (headers, combined)
 
@@ -718,15 +817,7 @@ class DoorScheduleParser:
                 if len(data_rows) >= 3:
                     self._log(f"Data found in table {t_idx} (close col count): {len(data_rows)} rows")
                     # Pad or trim rows to match header count
-                    adjusted = []
-                    for row in data_rows:
-                        if len(row) < col_count:
-                            adjusted.append(row + [''] * (col_count - len(row)))
-                        elif len(row) > col_count:
-                            adjusted.append(row[:col_count])
-                        else:
-                            adjusted.append(row)
-                    return (merged_headers, adjusted)
+                    return (merged_headers, self._normalize_rows(data_rows, col_count))
 
         return None
 
@@ -755,7 +846,8 @@ class DoorScheduleParser:
         data_start = 0
 
         for i, row in enumerate(table):
-            row_text = ' '.join(str(c or '').strip() for c in row).upper()
+            cells = [_clean_cell(c) for c in row]
+            row_text = ' '.join(cells).upper()
 
             # Is this a title row? (contains "SCHEDULE" or "DOOR SCHEDULE")
             if 'SCHEDULE' in row_text and i < 3:
@@ -764,19 +856,18 @@ class DoorScheduleParser:
 
             # Is this a header-like row? Check if cells are mostly text labels
             # vs data rows which have numbers, dimensions, abbreviations
-            non_empty = [str(c or '').strip() for c in row if c and str(c).strip()]
-            if not non_empty:
+            if not any(cells):
                 data_start = i + 1
                 continue
 
             # Check if this looks like a data row (has door-number-like content in first cell)
-            first_cell = str(row[0] or '').strip()
+            first_cell = cells[0] if cells else ''
             if first_cell and re.match(r'^\d{1,5}[A-Za-z]?$|^[A-Za-z]-\d{1,4}$|^[A-Za-z]\d{1,4}$', first_cell):
                 # This looks like a door number — data starts here
                 break
 
             # This is probably a header row
-            header_rows.append(row)
+            header_rows.append(cells)
             data_start = i + 1
 
         remaining = table[data_start:]
@@ -787,7 +878,7 @@ class DoorScheduleParser:
         # Step 2: Merge header rows into one
         if len(header_rows) == 1:
             # Single header row — clean it up
-            merged = [str(c or '').strip().replace('\n', ' ') for c in header_rows[0]]
+            merged = [c.replace('\n', ' ') for c in header_rows[0]]
             return (merged, remaining)
 
         # Multiple header rows — merge bottom-up (sub-headers take priority)
@@ -797,7 +888,7 @@ class DoorScheduleParser:
         # Start from the bottom row (most specific) and work up
         for row in reversed(header_rows):
             for i in range(min(len(row), col_count)):
-                cell = str(row[i] or '').strip().replace('\n', ' ')
+                cell = row[i].replace('\n', ' ')
                 if cell and not merged[i]:
                     merged[i] = cell
 
@@ -862,7 +953,7 @@ class DoorScheduleParser:
         for col_idx in range(col_count):
             values = []
             for row in data_rows:
-                v = str(row[col_idx] or '').strip() if col_idx < len(row) else ''
+                v = _clean_cell(row[col_idx]) if col_idx < len(row) else ''
                 values.append(v)
 
             non_empty = [v for v in values if v]
@@ -997,30 +1088,68 @@ class DoorScheduleParser:
         """Check if two rows are the same (header repeated on new page)."""
         if len(row1) != len(row2):
             return False
-        matches = sum(1 for a, b in zip(row1, row2)
-                      if _normalize_header(str(a or '')) == _normalize_header(str(b or '')))
-        return matches >= len(row1) * 0.7
+        # Stop as soon as 70% agreement is reached or can no longer be reached
+        needed = math.ceil(len(row1) * 0.7)
+        allowed_misses = len(row1) - needed
+        matches = misses = 0
+        for a, b in zip(row1, row2):
+            if matches >= needed:
+                return True
+            if _normalize_header(_clean_cell(a)) == _normalize_header(_clean_cell(b)):
+                matches += 1
+            else:
+                misses += 1
+                if misses > allowed_misses:
+                    return False
+        return matches >= needed
+
+    def _normalize_rows(self, rows: List[List],
+                        col_count: Optional[int] = None) -> List[List[str]]:
+        """
+        Clean every cell of a batch of table rows (None -> "", whitespace stripped).
+
+        If col_count is given, each row is padded or trimmed to that width;
+        otherwise each row keeps its original length.
+        """
+        cleaned = []
+        for row in rows:
+            vals = [_clean_cell(c) for c in row]
+            if col_count is not None:
+                if len(vals) < col_count:
+                    vals += [''] * (col_count - len(vals))
+                elif len(vals) > col_count:
+                    vals = vals[:col_count]
+            cleaned.append(vals)
+        return cleaned
 
     def _is_data_row(self, row: List) -> bool:
         """Check if a row contains actual data (not empty/separator)."""
-        non_empty = [c for c in row if c and str(c).strip()]
-        return len(non_empty) >= 2
+        non_empty = 0
+        for c in row:
+            if _clean_cell(c):
+                non_empty += 1
+                if non_empty >= 2:
+                    return True
+        return False
 
     def _row_to_door(self, row: List, col_mapping: Dict[int, str],
                      size_col: Optional[int] = None) -> Optional[DoorEntry]:
-        """Convert a table row to a DoorEntry."""
+        """Convert a table row (cells already cleaned by _normalize_rows) to a DoorEntry."""
         # Build a field dict from the row
         fields = {}
         raw = {}
-        for idx, cell in enumerate(row):
-            val = str(cell).strip() if cell else ""
-            raw[f"col_{idx}"] = val
+        for idx, val in enumerate(row):
+            raw[_COL_KEYS[idx] if idx < len(_COL_KEYS) else f"col_{idx}"] = val
             if idx in col_mapping:
                 field_name = col_mapping[idx]
                 fields[field_name] = val
 
+        for field_name in _INTERNED_FIELDS:
+            if field_name in fields:
+                fields[field_name] = sys.intern(fields[field_name])
+
         # Must have a door number
-        door_num = fields.get("door_number", "").strip()
+        door_num = fields.get("door_number", "")
         if not door_num:
             return None
 
@@ -1032,7 +1161,7 @@ class DoorScheduleParser:
         width = fields.get("width", "")
         height = fields.get("height", "")
         if not width and not height and size_col is not None:
-            size_val = str(row[size_col]).strip() if size_col < len(row) and row[size_col] else ""
+            size_val = row[size_col] if size_col < len(row) else ""
             if size_val:
                 width, height = parse_door_size(size_val)
 
@@ -1064,58 +1193,30 @@ class DoorScheduleParser:
 
         return door
 
-    def _infer_material_from_type(self, door_type: str) -> str:
-        """
-        Infer door material from type codes.
-        Common conventions:
-            VA = Vision Aluminum, VW = Vision Wood, VM = Vision Metal
-            FA = Flush Aluminum, FW = Flush Wood, FM = Flush Metal
-            SA = Storefront Aluminum
-        """
-        dt = door_type.upper().strip()
-        if len(dt) >= 2:
-            prefix = dt[:2]
-            material_codes = {
-                "VA": "aluminum", "SA": "aluminum", "AA": "aluminum",
-                "VW": "wood", "FW": "wood", "SW": "wood",
-                "VM": "hollow_metal", "FM": "hollow_metal", "HM": "hollow_metal",
-                "SM": "hollow_metal",
-            }
-            # Try first two characters
-            if prefix in material_codes:
-                return material_codes[prefix]
-            # Try just the second character (V=vision prefix, then material)
-            if len(dt) >= 2:
-                second = dt[1]
-                single_codes = {"A": "aluminum", "W": "wood", "M": "hollow_metal"}
-                if second in single_codes:
-                    return single_codes[second]
-        return ""
+    # Type codes repeat on nearly every row — the module-level function is cached
+    _infer_material_from_type = staticmethod(_infer_material_from_type)
 
     def _extract_from_text(self, page) -> List[List]:
         """
         Fallback: try to extract door data from page text when no table is detected.
         This handles schedules that don't have clear table lines.
+
+        Only reached for pages with no detectable table, so the text is
+        rebuilt straight from page.chars (see pdf_text).
         """
-        text = page.extract_text()
+        text = extract_page_text(page)
         if not text:
             return []
 
-        # Covers common door number formats: 1, 101, 101A, A-101, A101
-        _DOOR_NUM_RE = re.compile(
-            r'^\s*(\d{1,5}[A-Za-z]?|[A-Za-z]-\d{1,4}|[A-Za-z]\d{1,4})\s+'
-        )
-
         rows = []
-        for line in text.split('\n'):
-            if not _DOOR_NUM_RE.match(line):
-                continue
+        for m in _TEXT_ROW_RE.finditer(text):
+            line = m.group(0).strip()
             # Try double-space split first (most reliable for aligned columns)
-            parts = re.split(r'\s{2,}', line.strip())
+            parts = _CELL_GAP_RE.split(line)
             if len(parts) < 2:
                 # Fall back to any whitespace — risk of over-splitting multi-word
                 # cells, but better than dropping the row entirely
-                parts = line.strip().split()
+                parts = line.split()
             if len(parts) >= 2:
                 rows.append(parts)
 
@@ -1133,58 +1234,60 @@ class DoorScheduleParser:
             first_line = f.readline()
         sep = '\t' if '\t' in first_line else ','
 
-        df = pd.read_csv(csv_path, sep=sep, dtype=str).fillna('')
-        return self._parse_dataframe(df, csv_path)
+        # Read the header row alone, then only the columns that map to a
+        # DoorEntry field — wide exports often carry dozens of unused ones
+        headers = list(pd.read_csv(csv_path, sep=sep, dtype=str, nrows=0).columns)
+        usecols = _mapped_columns(map_columns(headers))
+        df = pd.read_csv(csv_path, sep=sep, dtype=str, usecols=usecols).fillna('')
+        return self._parse_dataframe(df, csv_path, headers=headers)
 
     def parse_excel(self, excel_path: str, sheet_name: int = 0) -> ParseResult:
         """Parse a door schedule from Excel file."""
         if not PANDAS_AVAILABLE:
             raise ImportError("pandas is required for Excel parsing")
 
-        df = pd.read_excel(excel_path, sheet_name=sheet_name, dtype=str).fillna('')
-        return self._parse_dataframe(df, excel_path)
+        with pd.ExcelFile(excel_path) as xls:
+            headers = list(xls.parse(sheet_name, dtype=str, nrows=0).columns)
+            usecols = _mapped_columns(map_columns(headers))
+            df = xls.parse(sheet_name, dtype=str, usecols=usecols).fillna('')
+        return self._parse_dataframe(df, excel_path, headers=headers)
 
-    def _parse_dataframe(self, df, source: str) -> ParseResult:
-        """Parse a pandas DataFrame into door entries."""
-        headers = list(df.columns)
-        col_mapping = map_columns(headers)
+    def _parse_dataframe(self, df, source: str,
+                         headers: Optional[List[str]] = None) -> ParseResult:
+        """
+        Parse a pandas DataFrame into door entries.
 
-        # Convert index-based mapping to use column names
-        idx_to_col = {i: headers[i] for i in col_mapping}
+        If df was read with only the mapped columns (usecols), pass the
+        file's full header row as headers.
+        """
+        full_width = headers is None
+        if full_width:
+            headers = list(df.columns)
+        col_mapping = map_columns(headers)
+        usecols = _mapped_columns(col_mapping)
 
         doors = []
         warnings = []
-        for _, row in df.iterrows():
-            fields = {}
-            for idx, field_name in col_mapping.items():
-                col_name = headers[idx]
-                fields[field_name] = str(row[col_name]).strip()
-
-            door_num = fields.get("door_number", "").strip()
-            if not door_num or _normalize_header(door_num) in ["door", "door #", ""]:
-                continue
-
-            door = DoorEntry(
-                door_number=door_num,
-                width=fields.get("width", ""),
-                height=fields.get("height", ""),
-                thickness=fields.get("thickness", ""),
-                material=fields.get("material", ""),
-                door_type=fields.get("door_type", ""),
-                manufacturer=fields.get("manufacturer", ""),
-                frame_material=fields.get("frame_material", ""),
-                fire_rating=fields.get("fire_rating", ""),
-                hardware_set=fields.get("hardware_set", ""),
-                glazing=fields.get("glazing", ""),
-                finish=fields.get("finish", ""),
-                room_name=fields.get("room_name", ""),
-                comments=fields.get("comments", ""),
-            )
 
-            if not door.material and door.door_type:
-                door.material = self._infer_material_from_type(door.door_type)
-
-            doors.append(door)
+        # Work column-wise: take the mapped columns under their field names,
+        # clean and filter them with vectorized pandas ops, and only drop to
+        # Python to construct the DoorEntry objects.
+        if "door_number" in col_mapping.values():
+            data = df.iloc[:, usecols].copy() if full_width else df.copy()
+            data.columns = [col_mapping[idx] for idx in usecols]
+            data = data.astype(str).apply(lambda col: col.str.strip())
+
+            door_nums = data["door_number"]
+            mask = door_nums.ne("") & ~door_nums.map(_normalize_header).isin(["door", "door #", ""])
+            data = data[mask]
+
+            if "door_type" in data.columns:
+                if "material" not in data.columns:
+                    data["material"] = ""
+                infer = data["material"].eq("") & data["door_type"].ne("")
+                data.loc[infer, "material"] = data.loc[infer, "door_type"].map(_infer_material_from_type)
+
+            doors = [DoorEntry(**rec) for rec in data.to_dict(orient="records")]
 
         readable_mapping = {headers[idx]: field_name for idx, field_name in col_mapping.items()}
 
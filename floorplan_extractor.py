@@ -8,17 +8,23 @@ Uses PyMuPDF (fitz) for text extraction with position data.
 """
 
 import re
+import sys
+from collections import Counter
 from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass, field
 
 try:
     import fitz  # PyMuPDF
     FITZ_AVAILABLE = True
+    # get_text("dict") defaults without TEXT_PRESERVE_IMAGES
+    _TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
 except ImportError:
     FITZ_AVAILABLE = False
 
+from pdf_text import page_batches, run_page_batches
 
-@dataclass
+
+@dataclass(slots=True)
 class ExtractedDoor:
     """A door number found on a floor plan."""
     number: str
@@ -27,6 +33,12 @@ class ExtractedDoor:
     y: float = 0
     original_text: str = ""
 
+    def __post_init__(self):
+        # Door numbers are compared case-insensitively — store them
+        # canonical (uppercase, interned: the same few numbers repeat
+        # across pages) so callers never re-uppercase
+        self.number = sys.intern(self.number.upper())
+
 
 @dataclass
 class ComparisonResult:
@@ -51,6 +63,14 @@ class ComparisonResult:
         }
 
 
+def _scan_pages(pdf_path: str, page_nums: range) -> List[ExtractedDoor]:
+    """Process-pool worker: scan a run of pages from its own document handle."""
+    extractor = FloorPlanExtractor()
+    with fitz.open(pdf_path) as doc:
+        return [door for page_num in page_nums
+                for door in extractor._scan_page(doc[page_num], page_num)]
+
+
 class FloorPlanExtractor:
     """
     Extracts door numbers from floor plan PDFs.
@@ -61,15 +81,18 @@ class FloorPlanExtractor:
         result = extractor.compare(doors, schedule_door_numbers)
     """
 
-    # Door number patterns — ordered from most specific to broadest
-    PATTERNS = [
-        # Standard: 101, 102, 201A, 100B
-        re.compile(r'\b([1-9]\d{2}[A-Za-z]?)\b'),
-        # With prefix: D-101, D101
-        re.compile(r'\b[Dd]-?(\d{2,4}[A-Za-z]?)\b'),
-        # Letter prefix: A-1, B-12 (less common)
-        re.compile(r'\b([A-Z]-\d{1,3}[A-Za-z]?)\b'),
-    ]
+    # Door number patterns — ordered from most specific to broadest, as named
+    # groups of one regex. Every candidate starts at a word boundary, so the
+    # scan stops once per word and each optional lookahead captures that
+    # pattern's candidate there; overlapping hits ("A-101" is both a
+    # letter-prefix number and contains 101) are all still reported.
+    DOOR_NUMBER_PATTERN = re.compile(r"""
+        \b(?=\w)
+        (?=(?P<standard>[1-9]\d{2}[A-Za-z]?)\b)?        # Standard: 101, 102, 201A, 100B
+        (?=[Dd]-?(?P<prefixed>\d{2,4}[A-Za-z]?)\b)?     # With prefix: D-101, D101
+        (?=(?P<letter>[A-Z]-\d{1,3}[A-Za-z]?)\b)?       # Letter prefix: A-1, B-12 (less common)
+    """, re.VERBOSE)
+    PATTERN_GROUPS = ("standard", "prefixed", "letter")
 
     # Context to exclude — these are NOT door numbers
     EXCLUDE_PATTERNS = [
@@ -80,9 +103,8 @@ class FloorPlanExtractor:
         re.compile(r"^\d+\s*[xX×]\s*\d+"),   # Dimensions: 24 X 24
         re.compile(r"^[A-Z]-\d{4}"),         # Model numbers: B-4288
     ]
-
-    def __init__(self):
-        pass
+    # All exclusions as one alternation — a single match() call per string
+    EXCLUDE_PATTERN = re.compile('|'.join(f'(?:{p.pattern})' for p in EXCLUDE_PATTERNS))
 
     def extract_from_pdf(self, pdf_path: str) -> List[ExtractedDoor]:
         """
@@ -97,58 +119,73 @@ class FloorPlanExtractor:
         if not FITZ_AVAILABLE:
             raise ImportError("PyMuPDF (fitz) is required. Install with: pip install PyMuPDF")
 
-        doors = []
-        seen = set()  # Track (number, page) to avoid duplicates
-
         doc = fitz.open(pdf_path)
-        for page_num, page in enumerate(doc):
-            # Get text with position info
-            blocks = page.get_text("dict")["blocks"]
-
-            for block in blocks:
-                if "lines" not in block:
-                    continue
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        if not text:
-                            continue
-
-                        # Check each pattern
-                        for pattern in self.PATTERNS:
-                            for match in pattern.finditer(text):
-                                candidate = match.group(1) if match.lastindex else match.group(0)
-                                candidate = candidate.strip()
-
-                                if not candidate:
-                                    continue
-
-                                # Skip if it matches an exclusion pattern
-                                if self._should_exclude(candidate, text):
-                                    continue
-
-                                key = (candidate.upper(), page_num)
-                                if key not in seen:
-                                    seen.add(key)
-                                    bbox = span["bbox"]
-                                    doors.append(ExtractedDoor(
-                                        number=candidate.upper(),
-                                        page=page_num + 1,
-                                        x=bbox[0],
-                                        y=bbox[1],
-                                        original_text=text,
-                                    ))
-
+        batches = page_batches(doc.page_count)
+        if len(batches) == 1:
+            candidates = [door for page_num, page in enumerate(doc)
+                          for door in self._scan_page(page, page_num)]
         doc.close()
-        return doors
-
-    def _should_exclude(self, candidate: str, context: str) -> bool:
+        if len(batches) > 1:
+            # Long sets: scan page batches in worker processes, each with
+            # its own document handle (PyMuPDF isn't thread-safe)
+            candidates = run_page_batches(_scan_pages, pdf_path, batches)
+
+        # (number, page) -> first door found there
+        doors_by_key: Dict[Tuple[str, int], ExtractedDoor] = {}
+        for door in candidates:
+            doors_by_key.setdefault((door.number, door.page), door)
+        return list(doors_by_key.values())
+
+    def _scan_page(self, page, page_num: int) -> List[ExtractedDoor]:
+        """Every door number candidate on one page, in reading order."""
+        candidates = []
+
+        # Exclusions and original_text work per span: a text line can hold
+        # several separately placed labels ("24 X 36" next to "DOOR 101"),
+        # and each one must be judged (and located) on its own. Embedded
+        # images are left out of the dict output — they're never text.
+        blocks = page.get_text("dict", flags=_TEXT_FLAGS)["blocks"]
+
+        for block in blocks:
+            for line in block.get("lines", ()):
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    if not text:
+                        continue
+
+                    # A span that itself looks like a dimension, spec
+                    # reference, etc. can't yield any door numbers
+                    if self.EXCLUDE_PATTERN.match(text):
+                        continue
+
+                    # One regex scan per span; candidates are then taken
+                    # pattern by pattern, most specific first
+                    matches = list(self.DOOR_NUMBER_PATTERN.finditer(text))
+                    for name in self.PATTERN_GROUPS:
+                        for match in matches:
+                            candidate = match.group(name)
+                            if not candidate:
+                                continue
+
+                            # Skip if it matches an exclusion pattern
+                            if self._should_exclude(candidate):
+                                continue
+
+                            x0, y0 = span["bbox"][:2]
+                            candidates.append(ExtractedDoor(
+                                number=candidate,
+                                page=page_num + 1,
+                                x=x0,
+                                y=y0,
+                                original_text=text,
+                            ))
+
+        return candidates
+
+    def _should_exclude(self, candidate: str) -> bool:
         """Check if a candidate door number should be excluded."""
-        for pattern in self.EXCLUDE_PATTERNS:
-            if pattern.match(candidate):
-                return True
-            if pattern.match(context):
-                return True
+        if self.EXCLUDE_PATTERN.match(candidate):
+            return True
 
         # Exclude pure single/double digit numbers that are likely labels
         if re.match(r'^\d{1,2}$', candidate):
@@ -176,17 +213,15 @@ class FloorPlanExtractor:
         Returns:
             ComparisonResult with matches and discrepancies
         """
-        plan_numbers = [d.number.upper() for d in extracted]
-        schedule_set = set(d.upper() for d in schedule_doors)
-        plan_set = set(plan_numbers)
+        counts = Counter(d.number for d in extracted)
+        plan_set = set(counts)
+        schedule_set = {d.upper() for d in schedule_doors}
 
         matched = sorted(schedule_set & plan_set)
         on_schedule_not_plan = sorted(schedule_set - plan_set)
         on_plan_not_schedule = sorted(plan_set - schedule_set)
 
         # Find duplicates
-        from collections import Counter
-        counts = Counter(plan_numbers)
         duplicates = {num: count for num, count in counts.items() if count > 1}
 
         return ComparisonResult(
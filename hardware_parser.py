@@ -13,7 +13,7 @@ Handles the standard DHI format:
 """
 
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet
 from dataclasses import dataclass, field
 
 try:
@@ -22,8 +22,10 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+from pdf_text import extract_page_text, page_batches, run_page_batches
 
-@dataclass
+
+@dataclass(slots=True)
 class HardwareComponent:
     """A single hardware item within a hardware set."""
     qty: int
@@ -33,6 +35,10 @@ class HardwareComponent:
     finish: str                  # e.g. "626"
     manufacturer: str            # e.g. "VON"
     raw_line: str = ""           # Original text
+    _desc_upper: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._desc_upper = self.description.upper()
 
     def to_dict(self) -> Dict:
         return {
@@ -45,7 +51,7 @@ class HardwareComponent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HardwareSet:
     """A complete hardware set (heading) with all components."""
     set_number: str
@@ -54,6 +60,12 @@ class HardwareSet:
     components: List[HardwareComponent] = field(default_factory=list)
     operational_description: str = ""
     notes: List[str] = field(default_factory=list)
+    # panic/closer/lockset flags, worked out in one pass and cached along
+    # with the components they were worked out from
+    _features: FrozenSet[str] = field(default=frozenset(), init=False,
+                                      repr=False, compare=False)
+    _features_of: Optional[tuple] = field(default=None, init=False,
+                                          repr=False, compare=False)
 
     def to_dict(self) -> Dict:
         return {
@@ -65,16 +77,33 @@ class HardwareSet:
             "notes": self.notes,
         }
 
+    def _get_features(self) -> FrozenSet[str]:
+        # components is a public list — recompute whenever its contents
+        # differ from the cached snapshot (an identity check per item when
+        # nothing changed)
+        components = tuple(self.components)
+        if components != self._features_of:
+            features = set()
+            for c in components:
+                desc = c._desc_upper
+                if 'PANIC' in desc or 'EXIT' in desc:
+                    features.add('panic_hardware')
+                if 'CLOSER' in desc:
+                    features.add('closer')
+                if any(kw in desc for kw in ['LOCK', 'LOCKSET', 'PASSAGE SET', 'PRIVACY']):
+                    features.add('lockset')
+            self._features = frozenset(features)
+            self._features_of = components
+        return self._features
+
     def has_panic_hardware(self) -> bool:
-        return any('PANIC' in c.description.upper() or 'EXIT' in c.description.upper()
-                   for c in self.components)
+        return 'panic_hardware' in self._get_features()
 
     def has_closer(self) -> bool:
-        return any('CLOSER' in c.description.upper() for c in self.components)
+        return 'closer' in self._get_features()
 
     def has_lockset(self) -> bool:
-        return any(kw in c.description.upper() for c in self.components
-                   for kw in ['LOCK', 'LOCKSET', 'PASSAGE SET', 'PRIVACY'])
+        return 'lockset' in self._get_features()
 
 
 @dataclass
@@ -97,6 +126,12 @@ class HardwareScheduleResult:
         return "\n".join(l for l in lines if l)
 
 
+def _read_page_texts(pdf_path: str, page_nums: range) -> List[str]:
+    """Process-pool worker: text of a run of pages, from its own file handle."""
+    with pdfplumber.open(pdf_path, pages=[n + 1 for n in page_nums]) as pdf:
+        return [extract_page_text(page) for page in pdf.pages]
+
+
 class HardwareScheduleParser:
     """
     Parses Section 08 71 00 hardware specification PDFs.
@@ -119,6 +154,22 @@ class HardwareScheduleParser:
 
     MFR_PATTERN = re.compile(r'\s+(\S+)\s+([A-Z]{2,4})\s*$')
 
+    # Document structure
+    _PAGE_FOOTER_RE = re.compile(r'^08\s*71\s*00\s*-\s*\d+')
+    _WRAPPED_HEADING_RE = re.compile(r'HEADING\s*#\s*\d+\s*-\s*\(')
+    _SET_HEADING_RE = re.compile(r'HEADING\s*#\s*(\d+)\s*-\s*\(([^)]+)\)')
+    _GROUP_RE = re.compile(r'Hardware\s+Group\s+No\.\s*(\d+)', re.IGNORECASE)
+    _DOOR_REF_RE = re.compile(r'For\s+use\s+on\s+Door\s*#?\(s\)\s*:\s*\n?\s*(.+?)(?:\n|$)', re.IGNORECASE)
+    _WHITESPACE_RE = re.compile(r'\s+')
+
+    # Inside a single set
+    _PROVIDE_RE = re.compile(r'PROVIDE\s+EACH\s+(SGL|PR|RU)\s')
+    _HEADING_RE = re.compile(r'HEADING\s*#')
+    _COMP_RE = re.compile(r'^(\d+)\s+(EA|SET|PR|BALANCE)\s+(.+?)$')
+    _COMP_PEEK_RE = re.compile(r'^\d+\s+(EA|SET|PR|BALANCE)')
+    _STOP_RE = re.compile(r'OPERATIONAL|ALL WIRING|HEADING #|PROVIDE EACH|DIVISION 26')
+    _DIGIT_RE = re.compile(r'\d')
+
     TYPE_KEYWORDS = {
         'panic_hardware': ['PANIC HARDWARE', 'EXIT HARDWARE', 'FIRE EXIT', 'EXIT DEVICE'],
         'lockset': ['MORTISE LOCK', 'STOREROOM LOCK', 'CLASSROOM LOCK', 'PRIVACY LOCK',
@@ -142,6 +193,22 @@ class HardwareScheduleParser:
 
     def __init__(self, debug: bool = False):
         self.debug = debug
+        # Leading-keyword matcher for _split_desc_catalog. Alternatives are in
+        # the same order the old loops tried them (type order, longest keyword
+        # first within a type), so the first alternative that matches wins
+        # exactly as before.
+        self._kw_pattern = re.compile('^(?:' + '|'.join(
+            re.escape(kw)
+            for keywords in self.TYPE_KEYWORDS.values()
+            for kw in sorted(keywords, key=len, reverse=True)
+        ) + ')')
+        # Component classifier for classify_component: one named lookahead per
+        # type, in TYPE_KEYWORDS order, so the first *type* with a keyword
+        # anywhere in the description wins (not the leftmost keyword).
+        self._type_re = re.compile('|'.join(
+            f'(?P<{type_name}>(?=.*?(?:' + '|'.join(re.escape(kw) for kw in keywords) + ')))'
+            for type_name, keywords in self.TYPE_KEYWORDS.items()
+        ), re.DOTALL)
 
     def _log(self, msg: str):
         if self.debug:
@@ -152,14 +219,18 @@ class HardwareScheduleParser:
         if not PDFPLUMBER_AVAILABLE:
             raise ImportError("pdfplumber is required")
 
-        full_text = ""
+        # Long specs are read in page batches across worker processes when
+        # PDF_WORKERS allows it; otherwise in-process. Either way collect the pages in a list and
+        # join once — repeated += on one long string recopies it per page.
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    full_text += text + "\n"
-
-        full_text = self._clean_text(full_text)
+            batches = page_batches(len(pdf.pages))
+            if len(batches) == 1:
+                texts = [extract_page_text(page) for page in pdf.pages]
+        if len(batches) > 1:
+            texts = run_page_batches(_read_page_texts, pdf_path, batches)
+        parts = [text for text in texts if text]
+
+        full_text = self._preprocess_text("\n".join(parts))
         hardware_sets = self._parse_hardware_sets(full_text)
 
         result = HardwareScheduleResult(
@@ -174,35 +245,49 @@ class HardwareScheduleParser:
 
         return result
 
-    def _clean_text(self, text: str) -> str:
-        """Remove page headers/footers."""
-        lines = text.split('\n')
-        cleaned = []
-        for line in lines:
+    def _preprocess_text(self, text: str) -> str:
+        """
+        Remove page headers/footers and rejoin heading lines that wrapped
+        across multiple lines, in a single pass over the document.
+        """
+        result = []
+        heading = None  # wrapped heading still waiting for its closing ")"
+        for line in text.split('\n'):
             stripped = line.strip()
-            if re.match(r'^08\s*71\s*00\s*-\s*\d+', stripped):
+            # Page headers/footers
+            if self._PAGE_FOOTER_RE.match(stripped):
                 continue
             if stripped == 'DOOR HARDWARE':
                 continue
             if stripped == 'QTY DESCRIPTION CATALOG NUMBER FINISH MFR':
                 continue
-            cleaned.append(line)
-        return '\n'.join(cleaned)
+
+            if heading is not None:
+                heading += ' ' + stripped
+                if ')' in heading.split('(', 1)[-1]:
+                    result.append(heading)
+                    heading = None
+            elif self._WRAPPED_HEADING_RE.search(line) and ')' not in line.split('(', 1)[-1]:
+                heading = line
+            else:
+                result.append(line)
+
+        if heading is not None:
+            result.append(heading)
+        return '\n'.join(result)
 
     def _parse_hardware_sets(self, text: str) -> Dict[str, HardwareSet]:
         """Parse all hardware sets from the document text."""
         sets = {}
-        text = self._rejoin_wrapped_headings(text)
 
         # Try Format 1: "HEADING # XX - (DESCRIPTION)"
-        heading_pattern = r'HEADING\s*#\s*(\d+)\s*-\s*\(([^)]+)\)'
-        matches = list(re.finditer(heading_pattern, text))
+        matches = list(self._SET_HEADING_RE.finditer(text))
 
         if matches:
             self._log(f"Detected format: HEADING # (found {len(matches)} sets)")
             for i, match in enumerate(matches):
                 set_num = match.group(1).lstrip('0') or '0'
-                description = re.sub(r'\s+', ' ', match.group(2).strip())
+                description = self._WHITESPACE_RE.sub(' ', match.group(2).strip())
                 start = match.end()
                 end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
                 content = text[start:end]
@@ -212,8 +297,7 @@ class HardwareScheduleParser:
             return sets
 
         # Try Format 2: "Hardware Group No. XX"
-        group_pattern = r'Hardware\s+Group\s+No\.\s*(\d+)'
-        matches = list(re.finditer(group_pattern, text, re.IGNORECASE))
+        matches = list(self._GROUP_RE.finditer(text))
 
         if matches:
             self._log(f"Detected format: Hardware Group No. (found {len(matches)} sets)")
@@ -224,7 +308,7 @@ class HardwareScheduleParser:
                 content = text[start:end]
 
                 # Extract description from "For use on Door #(s):" line
-                door_ref_match = re.search(r'For\s+use\s+on\s+Door\s*#?\(s\)\s*:\s*\n?\s*(.+?)(?:\n|$)', content, re.IGNORECASE)
+                door_ref_match = self._DOOR_REF_RE.search(content)
                 door_refs = door_ref_match.group(1).strip() if door_ref_match else ''
                 description = f"Doors: {door_refs}" if door_refs else ""
 
@@ -237,29 +321,11 @@ class HardwareScheduleParser:
         self._log("No standard format detected, trying generic pattern match")
         return sets
 
-    def _rejoin_wrapped_headings(self, text: str) -> str:
-        """Rejoin heading lines that wrapped across multiple lines."""
-        lines = text.split('\n')
-        result = []
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if re.match(r'.*HEADING\s*#\s*\d+\s*-\s*\(', line) and ')' not in line.split('(', 1)[-1]:
-                combined = line
-                while i + 1 < len(lines) and ')' not in combined.split('(', 1)[-1]:
-                    i += 1
-                    combined += ' ' + lines[i].strip()
-                result.append(combined)
-            else:
-                result.append(line)
-            i += 1
-        return '\n'.join(result)
-
     def _parse_single_set(self, set_num: str, description: str,
                           content: str) -> HardwareSet:
         """Parse a single hardware set."""
         door_type = "SGL"
-        provide_match = re.search(r'PROVIDE\s+EACH\s+(SGL|PR|RU)\s', content)
+        provide_match = self._PROVIDE_RE.search(content)
         if provide_match:
             door_type = provide_match.group(1)
 
@@ -285,7 +351,7 @@ class HardwareScheduleParser:
                 continue
 
             if in_op_desc:
-                if re.match(r'HEADING\s*#', line) or line.startswith('PROVIDE EACH'):
+                if self._HEADING_RE.match(line) or line.startswith('PROVIDE EACH'):
                     break
                 op_desc_lines.append(line)
                 continue
@@ -294,7 +360,7 @@ class HardwareScheduleParser:
                 notes.append(line)
                 continue
 
-            comp_match = re.match(r'^(\d+)\s+(EA|SET|PR|BALANCE)\s+(.+?)$', line)
+            comp_match = self._COMP_RE.match(line)
             if comp_match:
                 qty = int(comp_match.group(1))
                 unit = comp_match.group(2)
@@ -305,10 +371,9 @@ class HardwareScheduleParser:
                     next_line = lines[i].strip()
                     if not next_line:
                         break
-                    if re.match(r'^\d+\s+(EA|SET|PR|BALANCE)', next_line):
+                    if self._COMP_PEEK_RE.match(next_line):
                         break
-                    if any(kw in next_line for kw in ['OPERATIONAL', 'ALL WIRING',
-                           'HEADING #', 'PROVIDE EACH', 'DIVISION 26']):
+                    if self._STOP_RE.search(next_line):
                         break
                     rest += ' ' + next_line
                     i += 1
@@ -348,12 +413,11 @@ class HardwareScheduleParser:
 
     def _split_desc_catalog(self, text: str) -> tuple:
         """Split combined text into description and catalog number."""
-        for type_name, keywords in self.TYPE_KEYWORDS.items():
-            for kw in sorted(keywords, key=len, reverse=True):
-                if text.upper().startswith(kw):
-                    desc = kw
-                    catalog = text[len(kw):].strip()
-                    return (desc, catalog)
+        m = self._kw_pattern.match(text.upper())
+        if m:
+            desc = m.group(0)
+            catalog = text[len(desc):].strip()
+            return (desc, catalog)
 
         # Fallback: split at first word containing digits
         words = text.split()
@@ -361,7 +425,7 @@ class HardwareScheduleParser:
         cat_parts = []
         found_cat = False
         for word in words:
-            if not found_cat and not re.search(r'\d', word) and word.upper() == word:
+            if not found_cat and not self._DIGIT_RE.search(word) and word.upper() == word:
                 desc_parts.append(word)
             else:
                 found_cat = True
@@ -375,9 +439,5 @@ class HardwareScheduleParser:
 
     def classify_component(self, component: HardwareComponent) -> str:
         """Classify a component into a standard type category."""
-        desc = component.description.upper()
-        for type_name, keywords in self.TYPE_KEYWORDS.items():
-            for kw in keywords:
-                if kw in desc:
-                    return type_name
-        return 'other'
+        m = self._type_re.match(component._desc_upper)
+        return m.lastgroup if m else 'other'
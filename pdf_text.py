@@ -0,0 +1,185 @@
+"""
+PDF Page Text
+=============
+Fast plain-text extraction for pdfplumber pages.
+
+page.extract_text() rebuilds words and lines object-by-object in Python.
+For text-only pages (hardware specs, schedules with no detectable table)
+the same plain text can be rebuilt from page.chars, with the line
+clustering and ordering done in NumPy.
+
+Falls back to page.extract_text() when NumPy isn't installed or the page
+has rotated text.
+
+Also holds the page batching used to spread long PDFs over worker
+processes. Neither pdfplumber nor PyMuPDF objects can be shared between
+threads, so each worker opens the file itself and reads its own run of
+pages. This is opt-in: set PDF_WORKERS to the number of worker processes
+to allow (default 1, i.e. read every PDF in-process).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Any, Callable, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Same ligature expansion pdfplumber applies by default
+LIGATURES = {
+    "ﬀ": "ff", "ﬃ": "ffi", "ﬄ": "ffl", "ﬁ": "fi", "ﬂ": "fl", "ﬆ": "st", "ﬅ": "st",
+}
+
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+
+def _pdf_workers() -> int:
+    """
+    Worker processes allowed for one PDF: PDF_WORKERS, capped at the CPUs
+    this process may run on. Each worker re-opens and re-parses the file,
+    so on a small web instance extra workers only multiply memory — hence
+    off unless configured.
+    """
+    try:
+        requested = int(os.environ.get("PDF_WORKERS", "1"))
+    except ValueError:
+        requested = 1
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(requested, cpus))
+
+
+PDF_WORKERS = _pdf_workers()
+
+# One pool per process, started on first use and reused by every request
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def page_batches(page_count: int) -> List[range]:
+    """
+    Split page indexes into contiguous runs, one per worker process.
+    A single run means the document should be read in-process.
+    """
+    workers = min(PDF_WORKERS, page_count // PARALLEL_MIN_PAGES)
+    if workers < 2:
+        return [range(page_count)]
+    size = -(-page_count // workers)
+    return [range(start, min(start + size, page_count))
+            for start in range(0, page_count, size)]
+
+
+def run_page_batches(worker: Callable[[str, range], List], pdf_path: str,
+                     batches: List[range]) -> List:
+    """
+    Run worker(pdf_path, pages) for each batch in the shared process pool
+    and concatenate the results in page order. worker must be a
+    module-level function (it's pickled to the pool).
+
+    If a worker dies (e.g. killed for memory on a large PDF) the pool is
+    broken for good, so it's dropped — the next call starts a fresh one —
+    and this document is read in-process instead.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    try:
+        chunks = list(_pool.map(worker, repeat(pdf_path), batches))
+    except BrokenProcessPool:
+        _pool.shutdown(wait=False)
+        _pool = None
+        chunks = [worker(pdf_path, pages) for pages in batches]
+    return [item for chunk in chunks for item in chunk]
+
+
+def _cluster_ids(values: "np.ndarray", tolerance: float) -> "np.ndarray":
+    """
+    Cluster id for each value: distinct values are sorted and a new cluster
+    starts wherever the gap to the previous distinct value exceeds the
+    tolerance (pdfplumber's cluster_list, done in NumPy).
+    """
+    levels = np.unique(values)
+    level_cluster = np.concatenate(([0], np.cumsum(np.diff(levels) > tolerance)))
+    return level_cluster[np.searchsorted(levels, values)]
+
+
+def extract_page_text(page: Any, x_tolerance: float = 3, y_tolerance: float = 3) -> str:
+    """
+    Return a page's text as lines of space-separated words.
+
+    Mirrors pdfplumber's default (non-layout) extract_text():
+    - chars are bucketed into lines by top and sorted left to right
+    - a new word starts at a whitespace char, a gap wider than x_tolerance,
+      or a jump in top larger than y_tolerance
+    - words are then bucketed by their own top; consecutive words in the
+      same bucket form an output line
+    """
+    chars = page.chars
+    if not chars:
+        return ""
+    if not NUMPY_AVAILABLE or not all(c.get("upright", True) for c in chars):
+        return page.extract_text() or ""
+
+    n = len(chars)
+    tops = np.fromiter((c["top"] for c in chars), dtype=np.float64, count=n)
+    x0s = np.fromiter((c["x0"] for c in chars), dtype=np.float64, count=n)
+
+    # Chars -> words, walking each char line left to right
+    char_lines = _cluster_ids(tops, y_tolerance)
+    words = []      # word text
+    word_tops = []  # smallest char top in each word
+    word = []
+    word_top = 0.0
+    current_line = -1
+    prev = None
+    for i in np.lexsort((x0s, char_lines)).tolist():
+        c = chars[i]
+        text = c["text"]
+        if char_lines[i] != current_line or text.isspace() or (
+            prev is not None and (
+                c["x0"] > prev["x1"] + x_tolerance
+                or abs(c["top"] - prev["top"]) > y_tolerance
+            )
+        ):
+            if word:
+                words.append("".join(word))
+                word_tops.append(word_top)
+            word, prev = [], None
+            current_line = char_lines[i]
+            if text.isspace():
+                continue
+
+        if not word:
+            word_top = c["top"]
+        else:
+            word_top = min(word_top, c["top"])
+        word.append(LIGATURES.get(text, text))
+        prev = c
+
+    if word:
+        words.append("".join(word))
+        word_tops.append(word_top)
+    if not words:
+        return ""
+
+    # Words -> output lines: bucket words by their own top, and start a new
+    # line whenever consecutive words fall in different buckets
+    word_lines = _cluster_ids(np.asarray(word_tops), y_tolerance).tolist()
+    lines = []
+    line_words = [words[0]]
+    for i in range(1, len(words)):
+        if word_lines[i] != word_lines[i - 1]:
+            lines.append(" ".join(line_words))
+            line_words = []
+        line_words.append(words[i])
+    lines.append(" ".join(line_words))
+
+    return "\n".join(lines)
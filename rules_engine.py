@@ -12,21 +12,36 @@ The spreadsheet has two sheets:
 
 import os
 import re
+import sys
+from collections import Counter
+from datetime import date, datetime, time
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
+    CALAMINE_AVAILABLE = False
+
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 # ─────────────────────────────────────────────
 # Data Models
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """A single rule from the rules spreadsheet."""
     rule_id: str
@@ -43,6 +58,17 @@ class Rule:
     notes: str
     trigger_flags: str = ""  # e.g. "egress=true, ada_required=true"
 
+    # Derived once from the rule text: lowercased category/severity for the
+    # query filters, and the door-context requirement bits
+    _category_lc: str = field(init=False, repr=False, compare=False)
+    _severity_lc: str = field(init=False, repr=False, compare=False)
+    _req_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._category_lc = sys.intern(self.category.lower())
+        self._severity_lc = sys.intern(self.severity.lower())
+        self._req_mask = _requirement_mask(self)
+
     def matches_door_context(self, door_material: str, door_location: str = "",
                               has_glazing: bool = False, has_panic: bool = False,
                               is_fire_rated: bool = False, has_access_control: bool = False,
@@ -51,41 +77,76 @@ class Rule:
         Check if this rule is potentially relevant to a given door context.
         This is a broad filter — specific threshold checks happen in the checker.
         """
-        trigger = self.trigger_element.lower() if self.trigger_element else ""
-        condition = self.condition.lower() if self.condition else ""
-        category = self.category.lower() if self.category else ""
-
-        # Filter by trigger element
-        if trigger == "glazing" and not has_glazing:
-            return False
-
-        # Filter by specific conditions
-        if "auto operator" in condition and not has_auto_operator:
-            return False
-        if "fire rated" in condition and not is_fire_rated:
-            return False
-        if "fire door" in condition and not is_fire_rated:
-            return False
-        if "panic" in condition.lower() and not has_panic:
-            return False
-        if "access control" in condition and not has_access_control:
-            return False
-        if "vestibule" in condition and "vestibule" not in door_location.lower():
-            return False
-        if "stairwell" in condition and "stair" not in door_location.lower():
-            return False
-
-        # Filter by applies_to
-        applies = self.applies_to.lower() if self.applies_to else "both"
-        if applies == "exterior" and "exterior" not in door_location.lower():
-            # Only skip if we know it's interior
-            if "interior" in door_location.lower():
-                return False
-
-        return True
-
-
-@dataclass
+        ctx = _context_mask(door_location, has_glazing, has_panic, is_fire_rated,
+                            has_access_control, has_auto_operator)
+        return not self._req_mask & ~ctx
+
+
+# Requirement bits: a rule carrying a bit only applies to doors whose
+# context sets the same bit
+REQ_GLAZING = 1 << 0      # trigger element is glazing
+REQ_AUTO = 1 << 1         # condition mentions an auto operator
+REQ_FIRE = 1 << 2         # condition mentions a fire rated / fire door
+REQ_PANIC = 1 << 3        # condition mentions panic hardware
+REQ_ACCESS = 1 << 4       # condition mentions access control
+REQ_VESTIBULE = 1 << 5    # condition mentions a vestibule
+REQ_STAIR = 1 << 6        # condition mentions a stairwell
+REQ_EXTERIOR = 1 << 7     # applies to exterior doors only
+
+
+def _requirement_mask(rule: Rule) -> int:
+    """Requirement bits for a rule, from its trigger element, condition and applies-to."""
+    trigger = rule.trigger_element.lower() if rule.trigger_element else ""
+    condition = rule.condition.lower() if rule.condition else ""
+    applies = rule.applies_to.lower() if rule.applies_to else "both"
+
+    mask = 0
+    if trigger == "glazing":
+        mask |= REQ_GLAZING
+    if "auto operator" in condition:
+        mask |= REQ_AUTO
+    if "fire rated" in condition or "fire door" in condition:
+        mask |= REQ_FIRE
+    if "panic" in condition:
+        mask |= REQ_PANIC
+    if "access control" in condition:
+        mask |= REQ_ACCESS
+    if "vestibule" in condition:
+        mask |= REQ_VESTIBULE
+    if "stairwell" in condition:
+        mask |= REQ_STAIR
+    if applies == "exterior":
+        mask |= REQ_EXTERIOR
+    return mask
+
+
+def _context_mask(door_location: str = "", has_glazing: bool = False,
+                  has_panic: bool = False, is_fire_rated: bool = False,
+                  has_access_control: bool = False, has_auto_operator: bool = False) -> int:
+    """Requirement bits a door context satisfies."""
+    location = door_location.lower()
+    ctx = 0
+    if has_glazing:
+        ctx |= REQ_GLAZING
+    if has_auto_operator:
+        ctx |= REQ_AUTO
+    if is_fire_rated:
+        ctx |= REQ_FIRE
+    if has_panic:
+        ctx |= REQ_PANIC
+    if has_access_control:
+        ctx |= REQ_ACCESS
+    if "vestibule" in location:
+        ctx |= REQ_VESTIBULE
+    if "stair" in location:
+        ctx |= REQ_STAIR
+    # Exterior-only rules are skipped only when the door is known to be interior
+    if "exterior" in location or "interior" not in location:
+        ctx |= REQ_EXTERIOR
+    return ctx
+
+
+@dataclass(slots=True)
 class StileWidth:
     """A manufacturer-specific aluminum door stile width entry."""
     vendor: str
@@ -93,6 +154,13 @@ class StileWidth:
     series: str
     width: Optional[float]   # inches
     depth: Optional[float]   # inches
+    # Lookup keys (lowercased, stripped), worked out once
+    _vendor_lc: str = field(init=False, repr=False, compare=False)
+    _series_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._vendor_lc = self.vendor.lower().strip()
+        self._series_lc = self.series.lower().strip()
 
     def width_str(self) -> str:
         if self.width is None:
@@ -100,6 +168,180 @@ class StileWidth:
         return f'{self.width}"'
 
 
+# ─────────────────────────────────────────────
+# Workbook Reading
+# ─────────────────────────────────────────────
+
+# Cell text pandas' read_excel treated as missing (its default na_values),
+# plus Excel error values — kept so e.g. "N/A" or "#REF!" still reads as ""
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+    "#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#GETTING_DATA",
+})
+
+
+def _cell_str(value: Any) -> str:
+    """Render a cell value the way pandas' read_excel(dtype=str) used to."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return "" if value in _NA_STRINGS else value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return str(datetime.combine(value, time()))
+    return str(value)
+
+
+# Header text -> field, tried in priority order; the first pattern that
+# matches a (lowercased, stripped) header claims that column
+_RULE_HEADER_PATTERNS = tuple((re.compile(p, re.DOTALL), name) for p, name in (
+    (r"^(?=.*rule)(?=.*id)", "rule_id"),
+    (r"^what to check\Z|condition", "condition"),
+    (r"^fail when\Z|threshold", "threshold"),
+    (r"severity", "severity"),
+    (r"^(?=.*code)(?=.*ref)", "code_reference"),             # "code ref"
+    (r"^(?=.*trigger)(?=.*element)", "trigger_element"),
+    (r"applies", "applies_to"),
+    (r"confidence", "confidence"),
+    (r"failure|likelihood", "failure_likelihood"),
+    (r"fix|recommendation", "fix_recommendation"),          # "how to fix"
+    (r"^when to apply\Z|^(?=.*trigger)(?=.*flag)", "trigger_flags"),
+    (r"note", "notes"),
+))
+
+_STILE_HEADER_PATTERNS = tuple((re.compile(p, re.DOTALL), name) for p, name in (
+    (r"vendor|manufacturer|^mfr\Z", "vendor"),
+    (r"model", "model"),
+    (r"series", "series"),
+    (r"width", "width"),
+    (r"depth", "depth"),
+))
+
+
+def _map_headers(headers: List[str], patterns) -> Dict[str, int]:
+    """Field name -> column index; a later column wins if two match the same field."""
+    col_map = {}
+    for col, header in enumerate(headers):
+        cl = header.lower().strip()
+        for regex, name in patterns:
+            if regex.search(cl):
+                col_map[name] = col
+                break
+    return col_map
+
+
+class _Workbook:
+    """
+    Sheet names and mapped columns of a rules workbook.
+
+    Reads with python-calamine (Rust XLSX parser) when installed, otherwise
+    with openpyxl in read-only mode, which streams rows instead of building
+    the whole sheet in memory. Cells come back as strings ("" when empty).
+    Use as a context manager so the file is closed.
+    """
+
+    def __init__(self, filepath: str):
+        if CALAMINE_AVAILABLE:
+            self._book = CalamineWorkbook.from_path(filepath)
+            self.sheet_names: List[str] = list(self._book.sheet_names)
+        else:
+            self._book = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+            self.sheet_names = list(self._book.sheetnames)
+
+    def close(self):
+        if not CALAMINE_AVAILABLE:
+            self._book.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def columns(self, sheet_name: str, patterns,
+                names: Tuple[str, ...]) -> List[List[str]]:
+        """
+        Map the sheet's header row with patterns (see _map_headers) and
+        return the stripped text of each named column over all data rows,
+        one list per name ("" throughout for a column the sheet doesn't have).
+        Only the mapped columns are converted to text.
+        """
+        if CALAMINE_AVAILABLE:
+            # Keep leading blank rows/columns: the header is always the
+            # sheet's first row, as with openpyxl (and pandas before it)
+            rows = iter(self._book.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False))
+        else:
+            rows = self._book[sheet_name].iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return [[] for _ in names]
+        col_map = _map_headers([_cell_str(v) for v in header], patterns)
+        data = list(rows)
+        blank = [""] * len(data)
+        columns = []
+        for name in names:
+            col = col_map.get(name)
+            if col is None:
+                columns.append(blank)
+            else:
+                # Rows can come back shorter than the header (trailing
+                # empty cells); those read as ""
+                columns.append([_cell_str(row[col]).strip() if col < len(row) else ""
+                                for row in data])
+        return columns
+
+
+# Rule constructor arguments, in field order
+_RULE_COLUMNS = (
+    "rule_id", "category", "condition", "threshold", "severity",
+    "code_reference", "trigger_element", "applies_to", "confidence",
+    "failure_likelihood", "fix_recommendation", "notes", "trigger_flags",
+)
+
+# Small-vocabulary columns (Critical/Warning, Both/Exterior, ...) — interned
+# so every rule shares one string object per value
+_INTERNED_RULE_COLUMNS = tuple(_RULE_COLUMNS.index(name) for name in (
+    "category", "severity", "trigger_element", "applies_to", "confidence",
+    "failure_likelihood",
+))
+
+
+# ─────────────────────────────────────────────
+# Dimension Parsing
+# ─────────────────────────────────────────────
+
+_FRACTION_RE = re.compile(r'(\d+)\s+(\d+)/(\d+)')
+_DROP_QUOTES = str.maketrans('', '', '"\'')
+
+
+def _parse_dimension(s: str) -> Optional[float]:
+    """Parse a dimension string like '3.5\"' or '2 1/8\"' to float inches."""
+    if not s or s.lower() == "nan":
+        return None
+    s = s.translate(_DROP_QUOTES).strip()
+    # Plain decimals are the common case; a float can't contain "/", so
+    # trying it before the fraction pattern gives the same answer
+    try:
+        return float(s)
+    except ValueError:
+        pass
+    # Handle fractions
+    m = _FRACTION_RE.match(s)
+    if m:
+        return int(m.group(1)) + int(m.group(2)) / int(m.group(3))
+    return None
+
+
+def _parse_dimensions(values: List[str]) -> List[Optional[float]]:
+    """_parse_dimension over a whole column, parsing each distinct string once."""
+    parsed = {v: _parse_dimension(v) for v in set(values)}
+    return [parsed[v] for v in values]
+
+
 # ─────────────────────────────────────────────
 # Rules Engine
 # ─────────────────────────────────────────────
@@ -111,60 +353,110 @@ class RulesEngine:
     Usage:
         engine = RulesEngine()
         engine.load("data/rules.xlsx")
+        # or engine.load_lazy("data/rules.xlsx") to defer reading until first use
         
         rules = engine.get_rules_for_category("Fire Rating")
         stile = engine.lookup_stile("Kawneer", "350T")
     """
 
     def __init__(self):
-        self.rules: List[Rule] = []
-        self.stile_widths: List[StileWidth] = []
+        self._rules: List[Rule] = []
+        self._stile_widths: List[StileWidth] = []
         self.loaded = False
         self.source_file = ""
         self.load_errors: List[str] = []
+        # Workbook recorded by load_lazy(), read on first access
+        self._pending_file: Optional[str] = None
+        self._index_rules()
+        self._index_stiles()
+
+    @property
+    def rules(self) -> List[Rule]:
+        self._ensure_loaded()
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: List[Rule]):
+        # Finish a deferred load first so it can't overwrite these later
+        self._ensure_loaded()
+        self._rules = rules
+        self._index_rules()
+
+    @property
+    def stile_widths(self) -> List[StileWidth]:
+        self._ensure_loaded()
+        return self._stile_widths
+
+    @stile_widths.setter
+    def stile_widths(self, stile_widths: List[StileWidth]):
+        self._ensure_loaded()
+        self._stile_widths = stile_widths
+        self._index_stiles()
+
+    def load_lazy(self, filepath: str) -> bool:
+        """
+        Record the spreadsheet to load without reading it yet. The workbook
+        is parsed on first access to the rules, stile widths or any query
+        method, so startup doesn't pay for it. Load errors show up in
+        load_errors at that point.
+        """
+        if not os.path.exists(filepath):
+            self.load_errors.append(f"File not found: {filepath}")
+            return False
+        self._pending_file = filepath
+        self.source_file = filepath
+        return True
+
+    def _ensure_loaded(self):
+        """Run the deferred load from load_lazy(), if one is pending."""
+        if self._pending_file is not None:
+            filepath, self._pending_file = self._pending_file, None
+            self.load(filepath)
 
     def load(self, filepath: str) -> bool:
         """Load rules from an Excel spreadsheet."""
-        if not PANDAS_AVAILABLE:
-            self.load_errors.append("pandas is required to read Excel files")
+        if not (CALAMINE_AVAILABLE or OPENPYXL_AVAILABLE):
+            self.load_errors.append("python-calamine or openpyxl is required to read Excel files")
             return False
 
         if not os.path.exists(filepath):
             self.load_errors.append(f"File not found: {filepath}")
             return False
 
-        self.rules = []
-        self.stile_widths = []
+        self._pending_file = None
+        self._rules = []
+        self._index_rules()
+        self._stile_widths = []
+        self._index_stiles()
         self.load_errors = []
         self.source_file = filepath
 
         try:
-            xls = pd.ExcelFile(filepath)
-
-            # Identify stile widths sheet
-            stile_sheet = None
-            for name in xls.sheet_names:
-                if "stile" in name.lower() or "aluminum" in name.lower() or "width" in name.lower():
-                    stile_sheet = name
-                    break
-
-            # Load rules from all sheets (old single-sheet or new multi-tab format)
-            if "FenestrAI Rules" in xls.sheet_names:
-                # Old format: single rules sheet
-                self._load_rules_sheet(xls, sheet_name="FenestrAI Rules")
-            else:
-                # New format: load every sheet except stile widths as a rules tab
+            with _Workbook(filepath) as xls:
+                # Identify stile widths sheet
+                stile_sheet = None
                 for name in xls.sheet_names:
-                    if name == stile_sheet:
-                        continue
-                    try:
-                        self._load_rules_sheet(xls, sheet_name=name)
-                    except Exception as e:
-                        self.load_errors.append(f"Error loading tab '{name}': {str(e)}")
-
-            # Load stile widths
-            if stile_sheet:
-                self._load_stile_sheet(xls, sheet_name=stile_sheet)
+                    if "stile" in name.lower() or "aluminum" in name.lower() or "width" in name.lower():
+                        stile_sheet = name
+                        break
+
+                # Load rules from all sheets (old single-sheet or new multi-tab format)
+                if "FenestrAI Rules" in xls.sheet_names:
+                    # Old format: single rules sheet
+                    self._rules.extend(self._parse_rules_sheet(xls, sheet_name="FenestrAI Rules"))
+                else:
+                    # New format: load every sheet except stile widths as a rules tab
+                    for name in xls.sheet_names:
+                        if name == stile_sheet:
+                            continue
+                        try:
+                            self._rules.extend(self._parse_rules_sheet(xls, sheet_name=name))
+                        except Exception as e:
+                            self.load_errors.append(f"Error loading tab '{name}': {str(e)}")
+
+                # Load stile widths
+                if stile_sheet:
+                    self._load_stile_sheet(xls, sheet_name=stile_sheet)
 
             self.loaded = True
             return True
@@ -173,116 +465,99 @@ class RulesEngine:
             self.load_errors.append(f"Failed to load spreadsheet: {str(e)}")
             return False
 
-    def _load_rules_sheet(self, xls, sheet_name="FenestrAI Rules"):
-        """Parse the rules sheet into Rule objects. Handles both old and new column formats."""
-        df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str).fillna("")
-
-        # Normalize column names - handle both old format and new simplified format
-        col_map = {}
-        for col in df.columns:
-            cl = str(col).lower().strip()
-            if "rule" in cl and "id" in cl:
-                col_map["rule_id"] = col
-            elif cl == "what to check" or "condition" in cl:
-                col_map["condition"] = col
-            elif cl == "fail when" or "threshold" in cl:
-                col_map["threshold"] = col
-            elif "severity" in cl:
-                col_map["severity"] = col
-            elif cl == "code ref" or ("code" in cl and "ref" in cl):
-                col_map["code_reference"] = col
-            elif "trigger" in cl and "element" in cl:
-                col_map["trigger_element"] = col
-            elif "applies" in cl:
-                col_map["applies_to"] = col
-            elif "confidence" in cl:
-                col_map["confidence"] = col
-            elif "failure" in cl or "likelihood" in cl:
-                col_map["failure_likelihood"] = col
-            elif cl == "how to fix" or "fix" in cl or "recommendation" in cl:
-                col_map["fix_recommendation"] = col
-            elif cl == "when to apply" or ("trigger" in cl and "flag" in cl):
-                col_map["trigger_flags"] = col
-            elif "note" in cl:
-                col_map["notes"] = col
-
-        for _, row in df.iterrows():
-            rule_id = str(row.get(col_map.get("rule_id", ""), "")).strip()
-            if not rule_id or rule_id.lower() == "rule id":
-                continue
+        finally:
+            self._index_rules()
+
+    def _index_rules(self):
+        """Rebuild the rule lookup indexes from self._rules."""
+        # Lowercased severity -> rules, and lowercased category -> rule
+        # positions (categories are substring-matched, so results are put
+        # back in rule order)
+        self._rules_by_severity: Dict[str, List[Rule]] = {}
+        self._rule_pos_by_category: Dict[str, List[int]] = {}
+        for i, r in enumerate(self._rules):
+            self._rules_by_severity.setdefault(r._severity_lc, []).append(r)
+            self._rule_pos_by_category.setdefault(r._category_lc, []).append(i)
+        # get_rules_for_door results by context mask (at most 256 contexts)
+        self._rules_by_ctx: Dict[int, Tuple[Rule, ...]] = {}
+        # Requirement masks as one array, so a new context is filtered in
+        # a single vectorized pass
+        if NUMPY_AVAILABLE:
+            self._rule_req_masks = np.fromiter(
+                (r._req_mask for r in self._rules), dtype=np.int64, count=len(self._rules))
+
+    def _parse_rules_sheet(self, xls, sheet_name="FenestrAI Rules") -> List[Rule]:
+        """
+        Parse one rules sheet into Rule objects. Handles both old and new
+        column formats. Doesn't touch self._rules — load() merges each tab's
+        rules in sheet order, and a tab that fails to parse adds none.
+        """
+        # Normalize column names (old format and new simplified format),
+        # then pull each mapped column out whole and build rules row by row
+        # from the column lists
+        columns = xls.columns(sheet_name, _RULE_HEADER_PATTERNS, _RULE_COLUMNS)
+        if sheet_name != "FenestrAI Rules":
+            columns[1] = [sheet_name] * len(columns[0])  # category = tab name
+        for i in _INTERNED_RULE_COLUMNS:
+            columns[i] = [sys.intern(v) for v in columns[i]]
 
-            rule = Rule(
-                rule_id=rule_id,
-                category=sheet_name if sheet_name != "FenestrAI Rules" else str(row.get(col_map.get("category", ""), "")).strip(),
-                condition=str(row.get(col_map.get("condition", ""), "")).strip(),
-                threshold=str(row.get(col_map.get("threshold", ""), "")).strip(),
-                severity=str(row.get(col_map.get("severity", ""), "")).strip(),
-                code_reference=str(row.get(col_map.get("code_reference", ""), "")).strip(),
-                trigger_element=str(row.get(col_map.get("trigger_element", ""), "")).strip(),
-                applies_to=str(row.get(col_map.get("applies_to", ""), "")).strip(),
-                confidence=str(row.get(col_map.get("confidence", ""), "")).strip(),
-                failure_likelihood=str(row.get(col_map.get("failure_likelihood", ""), "")).strip(),
-                fix_recommendation=str(row.get(col_map.get("fix_recommendation", ""), "")).strip(),
-                notes=str(row.get(col_map.get("notes", ""), "")).strip(),
-                trigger_flags=str(row.get(col_map.get("trigger_flags", ""), "")).strip(),
-            )
-            self.rules.append(rule)
+        return [
+            Rule(*values) for values in zip(*columns)
+            if values[0] and values[0].lower() != "rule id"
+        ]
 
     def _load_stile_sheet(self, xls, sheet_name):
         """Parse the stile widths sheet."""
-        df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str).fillna("")
-
-        # Normalize columns
-        col_map = {}
-        for col in df.columns:
-            cl = str(col).lower().strip()
-            if "vendor" in cl or "manufacturer" in cl or cl == "mfr":
-                col_map["vendor"] = col
-            elif "model" in cl:
-                col_map["model"] = col
-            elif "series" in cl:
-                col_map["series"] = col
-            elif "width" in cl:
-                col_map["width"] = col
-            elif "depth" in cl:
-                col_map["depth"] = col
-
         current_vendor = ""
-        for _, row in df.iterrows():
-            vendor = str(row.get(col_map.get("vendor", ""), "")).strip()
+        entries = []
+        for vendor, model, series, width_str, depth_str in zip(*xls.columns(
+                sheet_name, _STILE_HEADER_PATTERNS, ("vendor", "model", "series", "width", "depth"))):
             if vendor and vendor.lower() not in ["vendor", "nan", ""]:
                 current_vendor = vendor
             elif not vendor:
                 vendor = current_vendor
 
-            series = str(row.get(col_map.get("series", ""), "")).strip()
             if not series or series.lower() in ["series", "nan", ""]:
                 continue
 
-            width_str = str(row.get(col_map.get("width", ""), "")).strip()
-            depth_str = str(row.get(col_map.get("depth", ""), "")).strip()
+            entries.append((vendor, model, series, width_str, depth_str))
 
-            self.stile_widths.append(StileWidth(
+        # Dimensions are parsed a column at a time, once per distinct string
+        widths = _parse_dimensions([e[3] for e in entries])
+        depths = _parse_dimensions([e[4] for e in entries])
+        for (vendor, model, series, _, _), width, depth in zip(entries, widths, depths):
+            self._stile_widths.append(StileWidth(
                 vendor=vendor,
-                model=str(row.get(col_map.get("model", ""), "")).strip(),
+                model=model,
                 series=series,
-                width=self._parse_dimension(width_str),
-                depth=self._parse_dimension(depth_str),
+                width=width,
+                depth=depth,
             ))
 
-    def _parse_dimension(self, s: str) -> Optional[float]:
-        """Parse a dimension string like '3.5\"' or '2.125\"' to float inches."""
-        if not s or s.lower() in ["nan", ""]:
-            return None
-        s = s.replace('"', '').replace("'", "").strip()
-        # Handle fractions
-        m = re.match(r'(\d+)\s+(\d+)/(\d+)', s)
-        if m:
-            return int(m.group(1)) + int(m.group(2)) / int(m.group(3))
-        try:
-            return float(s)
-        except ValueError:
-            return None
+        self._index_stiles()
+
+    def _index_stiles(self):
+        """Rebuild the stile lookup indexes from self._stile_widths."""
+        # (vendor, series) -> first entry, and vendor -> entries, both keyed
+        # lowercased/stripped and kept in sheet order
+        self._stile_by_vs: Dict[Tuple[str, str], StileWidth] = {}
+        self._stile_by_vendor: Dict[str, List[StileWidth]] = {}
+        positions: Dict[str, List[int]] = {}
+        for i, sw in enumerate(self._stile_widths):
+            self._stile_by_vs.setdefault((sw._vendor_lc, sw._series_lc), sw)
+            self._stile_by_vendor.setdefault(sw._vendor_lc, []).append(sw)
+            positions.setdefault(sw._vendor_lc, []).append(i)
+        self._vendors_sorted = sorted({sw.vendor for sw in self._stile_widths if sw.vendor})
+        # All widths packed into one float64 array (None becomes NaN, which
+        # never passes the tolerance test, same as a None width), then
+        # sliced per vendor, parallel to _stile_by_vendor
+        if NUMPY_AVAILABLE:
+            widths = np.array([sw.width for sw in self._stile_widths], dtype=np.float64)
+            self._stile_width_by_vendor: Dict[str, "np.ndarray"] = {
+                v: widths[pos] for v, pos in positions.items()
+            }
+
+    _parse_dimension = staticmethod(_parse_dimension)
 
     # ── Query Methods ──
 
@@ -290,74 +565,86 @@ class RulesEngine:
         return self.rules
 
     def get_rules_by_category(self, category: str) -> List[Rule]:
+        self._ensure_loaded()
         cat = category.lower()
-        return [r for r in self.rules if cat in r.category.lower()]
+        groups = [pos for c, pos in self._rule_pos_by_category.items() if cat in c]
+        if len(groups) == 1:
+            return [self._rules[i] for i in groups[0]]
+        return [self._rules[i] for i in sorted(i for pos in groups for i in pos)]
 
     def get_rules_by_severity(self, severity: str) -> List[Rule]:
-        sev = severity.lower()
-        return [r for r in self.rules if r.severity.lower() == sev]
+        self._ensure_loaded()
+        return list(self._rules_by_severity.get(severity.lower(), ()))
 
     def get_rules_for_door(self, door_material: str = "", door_location: str = "",
                            has_glazing: bool = False, has_panic: bool = False,
                            is_fire_rated: bool = False, has_access_control: bool = False,
                            has_auto_operator: bool = False) -> List[Rule]:
         """Get all rules that could apply to a specific door context."""
-        return [
-            r for r in self.rules
-            if r.matches_door_context(
-                door_material, door_location, has_glazing, has_panic,
-                is_fire_rated, has_access_control, has_auto_operator
-            )
-        ]
+        self._ensure_loaded()
+        ctx = _context_mask(door_location, has_glazing, has_panic, is_fire_rated,
+                            has_access_control, has_auto_operator)
+        # A door context reduces to its mask, so every door sharing one
+        # reuses the same filtered rules
+        rules = self._rules_by_ctx.get(ctx)
+        if rules is None:
+            if NUMPY_AVAILABLE:
+                hits = np.flatnonzero((self._rule_req_masks & ~ctx) == 0)
+                rules = tuple(self._rules[i] for i in hits.tolist())
+            else:
+                rules = tuple(r for r in self._rules if not r._req_mask & ~ctx)
+            self._rules_by_ctx[ctx] = rules
+        return list(rules)
 
     def lookup_stile(self, vendor: str, series: str) -> Optional[StileWidth]:
         """Look up a specific manufacturer's stile width by vendor and series."""
+        self._ensure_loaded()
         v = vendor.lower().strip()
         s = series.lower().strip()
-        for sw in self.stile_widths:
-            if sw.vendor.lower().strip() == v and sw.series.lower().strip() == s:
-                return sw
+        sw = self._stile_by_vs.get((v, s))
+        if sw is not None:
+            return sw
         # Try partial match on series
-        for sw in self.stile_widths:
-            if sw.vendor.lower().strip() == v and s in sw.series.lower():
+        for sw in self._stile_by_vendor.get(v, ()):
+            if s in sw._series_lc:
                 return sw
         return None
 
     def lookup_stile_by_width(self, vendor: str, width: float, tolerance: float = 0.25) -> List[StileWidth]:
         """Find stile entries matching a vendor and approximate width."""
+        self._ensure_loaded()
         v = vendor.lower().strip()
+        entries = self._stile_by_vendor.get(v)
+        if not entries:
+            return []
+        if NUMPY_AVAILABLE:
+            widths = self._stile_width_by_vendor[v]
+            return [entries[i] for i in np.flatnonzero(np.abs(widths - width) <= tolerance).tolist()]
         return [
-            sw for sw in self.stile_widths
-            if sw.vendor.lower().strip() == v
-            and sw.width is not None
+            sw for sw in entries
+            if sw.width is not None
             and abs(sw.width - width) <= tolerance
         ]
 
     def get_vendors(self) -> List[str]:
         """Get list of unique vendors in the stile database."""
-        vendors = set()
-        for sw in self.stile_widths:
-            if sw.vendor:
-                vendors.add(sw.vendor)
-        return sorted(vendors)
+        self._ensure_loaded()
+        return list(self._vendors_sorted)
 
     def get_stile_widths_for_vendor(self, vendor: str) -> List[StileWidth]:
         """Get all stile entries for a specific vendor."""
-        v = vendor.lower().strip()
-        return [sw for sw in self.stile_widths if sw.vendor.lower().strip() == v]
+        self._ensure_loaded()
+        return list(self._stile_by_vendor.get(vendor.lower().strip(), ()))
 
     def summary(self) -> Dict:
         """Get a summary of loaded rules and data."""
-        categories = {}
-        severities = {}
-        for r in self.rules:
-            categories[r.category] = categories.get(r.category, 0) + 1
-            severities[r.severity] = severities.get(r.severity, 0) + 1
+        categories = Counter(r.category for r in self.rules)
+        severities = Counter(r.severity for r in self.rules)
 
         return {
             "total_rules": len(self.rules),
-            "categories": categories,
-            "severities": severities,
+            "categories": dict(categories),
+            "severities": dict(severities),
             "stile_entries": len(self.stile_widths),
             "vendors": self.get_vendors(),
             "source": self.source_file,
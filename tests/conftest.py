@@ -0,0 +1,9 @@
+"""
+The app's modules live flat in the repo root — make them importable from
+the tests.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
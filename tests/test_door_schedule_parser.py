@@ -0,0 +1,42 @@
+"""
+Door schedule parsing from CSV.
+"""
+
+import pytest
+
+from door_schedule_parser import DoorScheduleParser
+
+pytest.importorskip("pandas")
+
+SCHEDULE_CSV = (
+    'DOOR NO.,TYPE,WIDTH,HEIGHT,MATERIAL,HDW SET,NOTES,EXTRA\n'
+    ' 101 ,VA1,"3\'-0""","7\'-0""",N/A,4,see note,x\n'
+    '102,FW1,36,84,,5,"a, b",y\n'
+    'Door #,,,,,,,\n'
+    ',,,,,,,\n'
+    '103,,36,84,Steel,,NA,z\n'
+    '0101,VW1,1e3,84,,01,,w\n'
+)
+
+
+@pytest.fixture
+def schedule_csv(tmp_path):
+    path = tmp_path / "schedule.csv"
+    path.write_text(SCHEDULE_CSV)
+    return str(path)
+
+
+def test_parse_csv_reads_mapped_columns(schedule_csv):
+    result = DoorScheduleParser().parse_csv(schedule_csv)
+
+    assert [d.door_number for d in result.doors] == ["101", "102", "103", "0101"]
+    first, second, third, fourth = result.doors
+    assert first.width == "3'-0\"" and first.hardware_set == "4"
+    assert first.material == "aluminum"     # "N/A" is empty, inferred from VA1
+    assert second.material == "wood"
+    assert second.comments == "a, b"
+    assert third.material == "Steel" and third.comments == ""
+    # Cells are read as text, never type-inferred
+    assert fourth.hardware_set == "01" and fourth.width == "1e3"
+    assert "EXTRA" not in result.column_mapping
+    assert result.raw_headers[0] == "DOOR NO."
@@ -0,0 +1,56 @@
+"""
+Floor plan door number extraction.
+"""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from floorplan_extractor import ExtractedDoor, FloorPlanExtractor
+
+
+@pytest.fixture
+def multi_span_pdf(tmp_path):
+    """
+    One page whose text lines each hold two separately set labels. The font
+    change makes PyMuPDF keep them as two spans of the same line.
+    """
+    doc = fitz.open()
+    page = doc.new_page()
+    labels = [
+        ((50, 100), "24 X 36", "helv"), ((88, 100), "DOOR 101", "tiro"),
+        ((50, 150), "ACC-01", "helv"), ((90, 150), "104", "tiro"),
+        ((50, 200), "ROOM", "helv"), ((82, 200), "102", "tiro"),
+    ]
+    for point, text, font in labels:
+        page.insert_text(point, text, fontname=font, fontsize=10)
+    path = tmp_path / "multi_span.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+def test_exclusions_apply_per_span(multi_span_pdf):
+    # A dimension or spec reference set next to a door number on the same
+    # line must not hide that door number
+    doors = FloorPlanExtractor().extract_from_pdf(multi_span_pdf)
+    assert sorted(d.number for d in doors) == ["101", "102", "104"]
+
+
+def test_door_position_and_text_are_the_span(multi_span_pdf):
+    doors = {d.number: d for d in FloorPlanExtractor().extract_from_pdf(multi_span_pdf)}
+    assert doors["101"].original_text == "DOOR 101"
+    assert doors["104"].original_text == "104"
+    assert doors["102"].original_text == "102"
+    assert doors["102"].x == pytest.approx(82)
+    assert doors["104"].x == pytest.approx(90)
+
+
+def test_compare_reflects_edits_to_extracted_list(multi_span_pdf):
+    extractor = FloorPlanExtractor()
+    doors = extractor.extract_from_pdf(multi_span_pdf)
+    doors[0] = ExtractedDoor("999", 1)
+
+    result = extractor.compare(doors, ["999", "102", "104"]).to_dict()
+    assert result["all_match"]
+    assert result["on_plan_not_schedule"] == []
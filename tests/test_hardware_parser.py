@@ -0,0 +1,26 @@
+"""
+Hardware set feature flags.
+"""
+
+from hardware_parser import HardwareComponent, HardwareSet
+
+
+def _component(description):
+    return HardwareComponent(qty=1, unit="EA", description=description,
+                             catalog_number="X", finish="626", manufacturer="VON")
+
+
+def test_feature_flags_follow_component_edits():
+    hw_set = HardwareSet("1", "Entry", "SGL", [_component("CLOSER")])
+    assert hw_set.has_closer()
+    assert not hw_set.has_panic_hardware()
+
+    hw_set.components.append(_component("PANIC HARDWARE"))
+    assert hw_set.has_panic_hardware()
+
+    hw_set.components[0] = _component("HINGES")
+    assert not hw_set.has_closer()
+
+    hw_set.components = [_component("LOCKSET")]
+    assert hw_set.has_lockset()
+    assert not hw_set.has_panic_hardware()
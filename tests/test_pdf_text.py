@@ -0,0 +1,35 @@
+"""
+Page batching across worker processes.
+"""
+
+import os
+
+import pdf_text
+
+_PARENT_PID = os.getpid()
+
+
+def _pages_or_die(pdf_path, pages):
+    """Worker that dies in a pool process and works in-process."""
+    if os.getpid() != _PARENT_PID:
+        os._exit(1)
+    return [f"{pdf_path}:{n}" for n in pages]
+
+
+def _pages(pdf_path, pages):
+    return [f"{pdf_path}:{n}" for n in pages]
+
+
+def test_broken_pool_falls_back_in_process_and_recovers(monkeypatch):
+    monkeypatch.setattr(pdf_text, "PDF_WORKERS", 2)
+    monkeypatch.setattr(pdf_text, "_pool", None)
+    batches = [range(0, 2), range(2, 4)]
+    expected = [f"doc.pdf:{n}" for n in range(4)]
+
+    assert pdf_text.run_page_batches(_pages_or_die, "doc.pdf", batches) == expected
+    assert pdf_text._pool is None
+
+    # The next document gets a fresh, working pool
+    assert pdf_text.run_page_batches(_pages, "doc.pdf", batches) == expected
+    assert pdf_text._pool is not None
+    pdf_text._pool.shutdown()
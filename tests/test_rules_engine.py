@@ -0,0 +1,89 @@
+"""
+Rules engine loading and lookups.
+"""
+
+import os
+
+import pytest
+
+import rules_engine
+from rules_engine import RulesEngine, StileWidth
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "data", "rules.xlsx")
+
+
+@pytest.fixture(autouse=True, params=["calamine", "openpyxl"])
+def workbook_reader(request, monkeypatch):
+    """Run every test against both workbook readers."""
+    if request.param == "calamine":
+        pytest.importorskip("python_calamine")
+    else:
+        pytest.importorskip("openpyxl")
+        monkeypatch.setattr(rules_engine, "CALAMINE_AVAILABLE", False)
+    return request.param
+
+
+@pytest.fixture
+def engine():
+    engine = RulesEngine()
+    assert engine.load(RULES_FILE)
+    return engine
+
+
+def test_load_lazy_matches_eager_load(engine):
+    lazy = RulesEngine()
+    assert lazy.load_lazy(RULES_FILE)
+    assert not lazy.loaded
+
+    assert lazy.get_vendors() == engine.get_vendors()
+    assert lazy.loaded
+    assert lazy.summary() == engine.summary()
+    assert (lazy.get_rules_for_door(door_location="exterior", has_glazing=True)
+            == engine.get_rules_for_door(door_location="exterior", has_glazing=True))
+
+
+def test_assigning_rules_reindexes(engine):
+    engine.rules = engine.rules[:3]
+    assert len(engine.get_rules_by_category("")) == 3
+    assert len(engine.get_rules_for_door()) <= 3
+    severity = engine.rules[0].severity
+    assert engine.get_rules_by_severity(severity)[0] is engine.rules[0]
+
+
+def test_assigning_stile_widths_reindexes(engine):
+    entry = StileWidth("K", "m", "350", 3.5, None)
+    engine.stile_widths = [entry]
+    assert engine.lookup_stile("K", "350") is entry
+    assert engine.get_vendors() == ["K"]
+    assert engine.lookup_stile_by_width("K", 3.5) == [entry]
+
+
+def test_assignment_after_load_lazy_keeps_stile_widths(engine):
+    lazy = RulesEngine()
+    lazy.load_lazy(RULES_FILE)
+    lazy.rules = []
+    assert lazy.rules == []
+    assert len(lazy.stile_widths) == len(engine.stile_widths)
+
+
+def test_header_is_always_the_first_row(tmp_path):
+    # A tab whose first row is blank has no header row, so it yields no
+    # rules, whichever reader loads it
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    main = wb.active
+    main.title = "Main"
+    main.append(["Rule ID", "Condition", "Severity"])
+    main.append(["M-1", "Check closer", "Critical"])
+    blank_top = wb.create_sheet("Blank top")
+    for col, value in enumerate(["Rule ID", "Condition", "Severity"], start=1):
+        blank_top.cell(row=2, column=col, value=value)
+    for col, value in enumerate(["B-1", "Check hinges", "Critical"], start=1):
+        blank_top.cell(row=3, column=col, value=value)
+    path = tmp_path / "rules.xlsx"
+    wb.save(path)
+
+    engine = RulesEngine()
+    assert engine.load(str(path))
+    assert [r.rule_id for r in engine.rules] == ["M-1"]